@@ -14,6 +14,7 @@ CREATE TABLE IF NOT EXISTS papers (
   year INTEGER,
   keywords TEXT[],
   raw_text_snippet TEXT,
+  metadata_source TEXT,
   processed_at TIMESTAMP WITH TIME ZONE,
   created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
   updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
@@ -1,17 +1,37 @@
 import argparse
+import functools
+import io
+import multiprocessing
 import os
 import re
 import unicodedata
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import date
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from xml.etree import ElementTree
 
 import psycopg2
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyPDF2 import PdfReader
 from PyPDF2.errors import PdfReadError
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 
 DEFAULT_DB_CONFIG = {
     "host": os.getenv("DB_HOST", "localhost"),
@@ -21,11 +41,77 @@ DEFAULT_DB_CONFIG = {
     "password": os.getenv("DB_PASSWORD", "academic"),
 }
 DEFAULT_GROBID_URL = os.getenv("GROBID_URL", "http://localhost:8070")
+DEFAULT_WORKERS = int(os.getenv("INGEST_WORKERS", "8"))
+TEXT_WORKERS = min(os.cpu_count() or 1, 4)
+BATCH_SIZE = 1000
+TEI = "{http://www.tei-c.org/ns/1.0}"
+# Clark-notation paths and tags avoid resolving the tei: prefix on every lookup.
+TITLE_PATH = f".//{TEI}titleStmt/{TEI}title"
+BIBL_STRUCT_PATH = f".//{TEI}biblStruct"
+CLASS_CODE_PATH = f".//{TEI}textClass//{TEI}classCode"
+TEXT_CLASS_TERM_PATH = f".//{TEI}textClass//{TEI}keywords//{TEI}term"
+KEYWORD_TERM_PATH = f".//{TEI}keywords//{TEI}term"
+SOURCE_AUTHOR_PATH = f".//{TEI}sourceDesc//{TEI}author"
+TITLE_STMT_AUTHOR_PATH = f".//{TEI}titleStmt//{TEI}author"
+PUBLICATION_DATE_PATH = f".//{TEI}publicationStmt//{TEI}date"
+IMPRINT_DATE_PATH = f".//{TEI}imprint//{TEI}date"
+JOURNAL_TITLE_PATH = f".//{TEI}monogr/{TEI}title[@level='j']"
+BOOK_TITLE_PATH = f".//{TEI}monogr/{TEI}title[@level='m']"
+MONOGR_TITLE_PATH = f".//{TEI}monogr/{TEI}title"
+PUBLISHER_PATH = f".//{TEI}publicationStmt/{TEI}publisher"
+IMPRINT_PUBLISHER_PATH = f".//{TEI}monogr/{TEI}imprint/{TEI}publisher"
+ABSTRACT_PATH = f".//{TEI}profileDesc/{TEI}abstract"
+SURNAME_PATH = f".//{TEI}surname"
+FORENAME_PATH = f".//{TEI}forename"
+AFFILIATION_TAG = f"{TEI}affiliation"
+ORG_NAME_TAG = f"{TEI}orgName"
+ADDRESS_TAG = f"{TEI}address"
+COUNTRY_TAG = f"{TEI}country"
+
+NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+UNDERSCORES_RE = re.compile(r"_+")
+YMD_RE = re.compile(r"\b(19|20)\d{2}-\d{2}-\d{2}\b")
+YM_RE = re.compile(r"\b(19|20)\d{2}-\d{2}\b")
+YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+KEYWORDS_RE = re.compile(r"(?:Keywords?|Index Terms?)\s*[:\-]\s*(.+)", re.IGNORECASE)
+AUTHORS_RE = re.compile(r"Authors?\s*[:\-]\s*(.+)", re.IGNORECASE)
+ABSTRACT_RE = re.compile(
+    r"\bAbstract\b\s*[:\-]?\s*(.+?)(?:\n\s*\n|\bIntroduction\b|\bKeywords\b)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # Only busy/unavailable responses and failed connects are retried: a read
+        # timeout means GROBID already has the upload, so resending it would just
+        # pile the same PDF onto a stuck server.
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across worker threads so GROBID connections are kept alive and reused.
+SESSION = build_session()
 
 
-def extract_text_from_pdf(pdf_path: Path, max_pages: int = 2) -> str:
+def extract_text_from_pdf(pdf_bytes: bytes, max_pages: int = 2) -> str:
+    if pdfium is not None:
+        return extract_text_pdfium(pdf_bytes, max_pages)
     try:
-        reader = PdfReader(str(pdf_path))
+        reader = PdfReader(io.BytesIO(pdf_bytes))
     except PdfReadError:
         return ""
     text_chunks = []
@@ -36,11 +122,31 @@ def extract_text_from_pdf(pdf_path: Path, max_pages: int = 2) -> str:
     return "\n".join(text_chunks)
 
 
+def extract_text_pdfium(pdf_bytes: bytes, max_pages: int = 2) -> str:
+    text_chunks = []
+    try:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+    except pdfium.PdfiumError:
+        return ""
+    try:
+        for index in range(min(len(pdf), max_pages)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            if page_text:
+                text_chunks.append(page_text)
+    finally:
+        pdf.close()
+    return "\n".join(text_chunks)
+
+
 def to_ascii_slug(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value)
     ascii_value = normalized.encode("ascii", "ignore").decode("ascii")
-    ascii_value = re.sub(r"[^A-Za-z0-9]+", "_", ascii_value).strip("_")
-    return re.sub(r"_+", "_", ascii_value).lower()
+    ascii_value = NON_ALNUM_RE.sub("_", ascii_value).strip("_")
+    return UNDERSCORES_RE.sub("_", ascii_value).lower()
 
 
 def build_filename(metadata: Dict) -> str:
@@ -73,9 +179,12 @@ def rename_pdf(pdf_path: Path, metadata: Dict, dry_run: bool) -> Path:
     return target_path
 
 
+@functools.lru_cache(maxsize=1)
 def grobid_is_available(base_url: str) -> bool:
+    # Plain requests.get: the shared session's retries would only delay the
+    # fallback when GROBID is down.
     try:
-        response = requests.get(f"{base_url}/api/isalive", timeout=2)
+        response = requests.get(f"{base_url}/api/isalive", timeout=0.5)
         return response.ok
     except requests.RequestException:
         return False
@@ -84,18 +193,21 @@ def grobid_is_available(base_url: str) -> bool:
 def normalize_whitespace(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
-    return " ".join(value.split()).strip() or None
+    words = value.split()
+    return " ".join(words) if words else None
 
 
 def element_text(element: Optional[ElementTree.Element]) -> Optional[str]:
     if element is None:
         return None
+    if len(element) == 0:
+        return normalize_whitespace(element.text)
     return normalize_whitespace(" ".join(element.itertext()))
 
 
-def parse_grobid_author(author_el: ElementTree.Element, ns: Dict[str, str]) -> Optional[str]:
-    surname = author_el.findtext(".//tei:surname", namespaces=ns) or ""
-    forenames = author_el.findall(".//tei:forename", namespaces=ns)
+def parse_grobid_author(author_el: ElementTree.Element) -> Optional[str]:
+    surname = author_el.findtext(SURNAME_PATH) or ""
+    forenames = author_el.findall(FORENAME_PATH)
     forename = " ".join([el.text for el in forenames if el.text]) if forenames else ""
     full_name = " ".join(part for part in [forename, surname] if part).strip()
     return full_name or None
@@ -105,31 +217,31 @@ def parse_publication_date(value: Optional[str]) -> Optional[date]:
     if not value:
         return None
     value = value.strip()
-    match = re.search(r"\b(19|20)\d{2}-\d{2}-\d{2}\b", value)
+    match = YMD_RE.search(value)
     if match:
         return date.fromisoformat(match.group(0))
-    match = re.search(r"\b(19|20)\d{2}-\d{2}\b", value)
+    match = YM_RE.search(value)
     if match:
         year, month = match.group(0).split("-")
         return date(int(year), int(month), 1)
-    match = re.search(r"\b(19|20)\d{2}\b", value)
+    match = YEAR_RE.search(value)
     if match:
         return date(int(match.group(0)), 1, 1)
     return None
 
 
-def extract_document_type(root: ElementTree.Element, ns: Dict[str, str]) -> Optional[str]:
-    bibl_struct = root.find(".//tei:biblStruct", namespaces=ns)
+def extract_document_type(root: ElementTree.Element) -> Optional[str]:
+    bibl_struct = root.find(BIBL_STRUCT_PATH)
     if bibl_struct is not None:
         bibl_type = bibl_struct.attrib.get("type")
         if bibl_type:
             return normalize_whitespace(bibl_type)
 
-    for class_code in root.findall(".//tei:textClass//tei:classCode", namespaces=ns):
+    for class_code in root.findall(CLASS_CODE_PATH):
         if class_code.text:
             return normalize_whitespace(class_code.text)
 
-    for term in root.findall(".//tei:textClass//tei:keywords//tei:term", namespaces=ns):
+    for term in root.findall(TEXT_CLASS_TERM_PATH):
         if term.text and len(term.text.split()) <= 4:
             candidate = term.text.strip().lower()
             if candidate in {"article", "review", "book", "chapter", "conference", "preprint"}:
@@ -137,82 +249,88 @@ def extract_document_type(root: ElementTree.Element, ns: Dict[str, str]) -> Opti
     return None
 
 
-def extract_affiliations(author_el: ElementTree.Element, ns: Dict[str, str]) -> List[str]:
+def extract_author_affiliations(author_el: ElementTree.Element) -> Tuple[List[str], List[str]]:
     affiliations = []
-    for aff in author_el.findall(".//tei:affiliation", namespaces=ns):
+    countries = []
+    for aff in author_el.iter(AFFILIATION_TAG):
         parts = []
-        for org in aff.findall(".//tei:orgName", namespaces=ns):
-            org_text = element_text(org)
-            if org_text:
-                parts.append(org_text)
-        address = aff.find(".//tei:address", namespaces=ns)
-        address_text = element_text(address)
+        address_text = None
+        for element in aff.iter():
+            if element.tag == ORG_NAME_TAG:
+                org_text = element_text(element)
+                if org_text:
+                    parts.append(org_text)
+            elif element.tag == ADDRESS_TAG:
+                if address_text is None:
+                    address_text = element_text(element) or ""
+            elif element.tag == COUNTRY_TAG:
+                country = normalize_whitespace(element.text)
+                if country:
+                    countries.append(country)
         if address_text:
             parts.append(address_text)
         if parts:
-            affiliations.append(normalize_whitespace(", ".join(parts)))
-    return [aff for aff in affiliations if aff]
+            affiliation = normalize_whitespace(", ".join(parts))
+            if affiliation:
+                affiliations.append(affiliation)
+    return affiliations, countries
 
 
-def extract_countries(author_el: ElementTree.Element, ns: Dict[str, str]) -> List[str]:
-    countries = []
-    for country_el in author_el.findall(".//tei:affiliation//tei:address//tei:country", namespaces=ns):
-        country = normalize_whitespace(country_el.text)
-        if country:
-            countries.append(country)
-    return countries
-
-
-def extract_metadata_grobid(pdf_path: Path, base_url: str) -> Optional[Dict]:
+def extract_metadata_grobid(pdf_bytes: bytes, base_url: str) -> Optional[Dict]:
     try:
-        with pdf_path.open("rb") as handle:
-            response = requests.post(
-                f"{base_url}/api/processHeaderDocument",
-                files={"input": handle},
-                data={"consolidateHeader": "1"},
-                headers={"Accept": "application/xml"},
-                timeout=30,
-            )
+        response = SESSION.post(
+            f"{base_url}/api/processHeaderDocument",
+            files={"input": ("paper.pdf", pdf_bytes, "application/pdf")},
+            data={"consolidateHeader": "1"},
+            headers={"Accept": "application/xml"},
+            timeout=30,
+        )
         response.raise_for_status()
     except requests.RequestException:
         return None
 
     try:
-        root = ElementTree.fromstring(response.text)
+        root = ElementTree.fromstring(response.content)
     except ElementTree.ParseError:
         return None
 
-    ns = {"tei": "http://www.tei-c.org/ns/1.0"}
-    title = root.findtext(".//tei:titleStmt/tei:title", namespaces=ns)
-    document_type = extract_document_type(root, ns)
+    title = root.findtext(TITLE_PATH)
+    document_type = extract_document_type(root)
 
     authors = []
     affiliations = []
     countries = []
-    for author_el in root.findall(".//tei:sourceDesc//tei:author", namespaces=ns):
-        author_name = parse_grobid_author(author_el, ns)
+    for author_el in root.findall(SOURCE_AUTHOR_PATH):
+        author_name = parse_grobid_author(author_el)
         if author_name:
             authors.append(author_name)
-        affiliations.extend(extract_affiliations(author_el, ns))
-        countries.extend(extract_countries(author_el, ns))
+        author_affiliations, author_countries = extract_author_affiliations(author_el)
+        affiliations.extend(author_affiliations)
+        countries.extend(author_countries)
 
     if not authors:
-        for author_el in root.findall(".//tei:titleStmt//tei:author", namespaces=ns):
-            author_name = parse_grobid_author(author_el, ns)
+        # Only fall back for affiliations too if sourceDesc had none of its own.
+        needs_affiliations = not affiliations and not countries
+        for author_el in root.findall(TITLE_STMT_AUTHOR_PATH):
+            author_name = parse_grobid_author(author_el)
             if author_name:
                 authors.append(author_name)
-            affiliations.extend(extract_affiliations(author_el, ns))
-            countries.extend(extract_countries(author_el, ns))
-
-    keywords = [
-        term.text.strip()
-        for term in root.findall(".//tei:keywords//tei:term", namespaces=ns)
-        if term.text and term.text.strip()
-    ]
+            if needs_affiliations:
+                author_affiliations, author_countries = extract_author_affiliations(author_el)
+                affiliations.extend(author_affiliations)
+                countries.extend(author_countries)
+
+    keywords = list(
+        dict.fromkeys(
+            term.text.strip()
+            for term in root.findall(KEYWORD_TERM_PATH)
+            if term.text and term.text.strip()
+        )
+    )
 
     year = None
     publication_date = None
-    for date_el in root.findall(".//tei:publicationStmt//tei:date", namespaces=ns):
+    for date_el in root.findall(PUBLICATION_DATE_PATH):
         publication_date = parse_publication_date(date_el.attrib.get("when") or date_el.text)
         if publication_date:
             year = publication_date.year
@@ -228,23 +346,24 @@ def extract_metadata_grobid(pdf_path: Path, base_url: str) -> Optional[Dict]:
                 break
 
     if not publication_date:
-        for date_el in root.findall(".//tei:imprint//tei:date", namespaces=ns):
+        for date_el in root.findall(IMPRINT_DATE_PATH):
             publication_date = parse_publication_date(date_el.attrib.get("when") or date_el.text)
             if publication_date:
                 year = publication_date.year
                 break
 
-    journal_title = root.findtext(".//tei:monogr/tei:title[@level='j']", namespaces=ns)
-    book_title = root.findtext(".//tei:monogr/tei:title[@level='m']", namespaces=ns)
+    journal_title = root.findtext(JOURNAL_TITLE_PATH)
+    book_title = root.findtext(BOOK_TITLE_PATH)
     if not journal_title and not book_title:
-        book_title = root.findtext(".//tei:monogr/tei:title", namespaces=ns)
+        book_title = root.findtext(MONOGR_TITLE_PATH)
 
-    publisher = root.findtext(".//tei:publicationStmt/tei:publisher", namespaces=ns)
+    publisher = root.findtext(PUBLISHER_PATH)
     if not publisher:
-        publisher = root.findtext(".//tei:monogr/tei:imprint/tei:publisher", namespaces=ns)
+        publisher = root.findtext(IMPRINT_PUBLISHER_PATH)
 
-    abstract = element_text(root.find(".//tei:profileDesc/tei:abstract", namespaces=ns))
+    abstract = element_text(root.find(ABSTRACT_PATH))
 
+    # Lists are deduped in first-seen order, which follows the author order.
     return {
         "title": title,
         "document_type": document_type,
@@ -253,16 +372,17 @@ def extract_metadata_grobid(pdf_path: Path, base_url: str) -> Optional[Dict]:
         "book_title": book_title,
         "publisher": publisher,
         "authors": authors or None,
-        "affiliations": sorted(set(affiliations)) or None,
-        "countries": sorted(set(countries)) or None,
+        "affiliations": list(dict.fromkeys(affiliations)) or None,
+        "countries": list(dict.fromkeys(countries)) or None,
         "abstract": abstract,
         "year": year,
         "keywords": keywords or None,
+        "metadata_source": "grobid",
     }
 
 
 def extract_year(text: str) -> Optional[int]:
-    match = re.search(r"\b(19|20)\d{2}\b", text)
+    match = YEAR_RE.search(text)
     if match:
         return int(match.group(0))
     return None
@@ -281,11 +401,7 @@ def split_keywords(keywords_line: str) -> List[str]:
 
 
 def extract_keywords(text: str) -> List[str]:
-    match = re.search(
-        r"(?:Keywords?|Index Terms?)\s*[:\-]\s*(.+)",
-        text,
-        flags=re.IGNORECASE,
-    )
+    match = KEYWORDS_RE.search(text)
     if not match:
         return []
     line = match.group(1).splitlines()[0]
@@ -294,7 +410,7 @@ def extract_keywords(text: str) -> List[str]:
 
 def extract_authors(lines: List[str]) -> List[str]:
     for line in lines[:5]:
-        match = re.search(r"Authors?\s*[:\-]\s*(.+)", line, flags=re.IGNORECASE)
+        match = AUTHORS_RE.search(line)
         if match:
             return split_authors(match.group(1))
     if len(lines) > 1 and len(lines[1]) <= 120:
@@ -309,11 +425,7 @@ def extract_title(lines: List[str]) -> Optional[str]:
 
 
 def extract_abstract(text: str) -> Optional[str]:
-    match = re.search(
-        r"\bAbstract\b\s*[:\-]?\s*(.+?)(?:\n\s*\n|\bIntroduction\b|\bKeywords\b)",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    match = ABSTRACT_RE.search(text)
     if not match:
         return None
     return normalize_whitespace(match.group(1))
@@ -341,37 +453,199 @@ def extract_metadata(text: str) -> Dict:
         "year": year,
         "keywords": keywords or None,
         "raw_text_snippet": raw_text_snippet,
+        "metadata_source": "heuristic",
     }
 
 
-def iter_pdfs(directory: Path, recursive: bool) -> List[Path]:
-    pattern = "**/*.pdf" if recursive else "*.pdf"
-    return list(directory.glob(pattern))
+def process_pdf(
+    pdf_path: Path, use_grobid: bool, grobid_url: str, text_executor: Executor
+) -> Tuple[Path, Dict]:
+    # Read once and share the bytes between GROBID and the local text extractor.
+    pdf_bytes = pdf_path.read_bytes()
+    metadata = None
+    if use_grobid:
+        metadata = extract_metadata_grobid(pdf_bytes, grobid_url)
+    if metadata:
+        # Local text extraction is the slowest step, so only pay for it on fallback.
+        abstract = metadata["abstract"]
+        metadata["raw_text_snippet"] = abstract[:500].strip() if abstract else None
+    else:
+        # Text extraction is CPU-bound, so it runs in a worker process off the GIL.
+        text = text_executor.submit(extract_text_from_pdf, pdf_bytes).result()
+        metadata = extract_metadata(text)
+    return pdf_path, metadata
+
+
+def process_pdfs(
+    executor: Executor,
+    text_executor: Executor,
+    pdf_paths: Iterable[Path],
+    use_grobid: bool,
+    grobid_url: str,
+    max_pending: int,
+) -> Iterator[Tuple[Path, Dict]]:
+    """Yield results as they complete, keeping at most max_pending PDFs in flight.
+
+    Results start flowing to the caller while the directory scan is still
+    running, instead of only after every file has been submitted.
+    """
+    pending = set()
+    for pdf_path in pdf_paths:
+        pending.add(executor.submit(process_pdf, pdf_path, use_grobid, grobid_url, text_executor))
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    for future in as_completed(pending):
+        yield future.result()
+
+
+def iter_pdfs(directory: Path, recursive: bool) -> Iterator[Path]:
+    stack = [directory]
+    while stack:
+        # Like Path.glob, skip directories that are unreadable or vanished mid-run.
+        try:
+            entries = os.scandir(stack.pop())
+        except (PermissionError, FileNotFoundError):
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(Path(entry.path))
+                elif entry.name.endswith(".pdf") and entry.is_file():
+                    yield Path(entry.path)
+
+
+PAPER_COLUMNS = (
+    "file_path",
+    "title",
+    "document_type",
+    "publication_date",
+    "journal_title",
+    "book_title",
+    "publisher",
+    "authors",
+    "affiliations",
+    "countries",
+    "abstract",
+    "year",
+    "keywords",
+    "raw_text_snippet",
+    "metadata_source",
+)
+
+
+def prepare_bulk_load(conn) -> None:
+    # Session-level settings: they only apply to this connection and end with it.
+    # A crash can lose the final commit, which the next run simply re-ingests.
+    # Everything is sent as one multi-statement query to save round trips.
+    # The ALTER upgrades databases created before metadata_source existed.
+    columns = ", ".join(PAPER_COLUMNS)
+    with conn.cursor() as cur:
+        cur.execute(
+            f"""
+            ALTER TABLE papers ADD COLUMN IF NOT EXISTS metadata_source TEXT;
+            SET synchronous_commit = off;
+            SET work_mem = '64MB';
+            CREATE TEMP TABLE papers_stage ON COMMIT DELETE ROWS AS
+            SELECT {columns} FROM papers WITH NO DATA;
+            """
+        )
 
 
-def upsert_paper(conn, file_path: Path, metadata: dict) -> None:
+def fetch_processed_times(conn, directory: Path, grobid_only: bool) -> Dict[str, float]:
+    # With GROBID up, rows that only got heuristic metadata are left out so they
+    # are retried instead of being skipped forever. Rows of unknown origin
+    # (stored before metadata_source existed) are always retried.
     with conn.cursor() as cur:
         cur.execute(
             """
-            INSERT INTO papers (
-                file_path,
-                title,
-                document_type,
-                publication_date,
-                journal_title,
-                book_title,
-                publisher,
-                authors,
-                affiliations,
-                countries,
-                abstract,
-                year,
-                keywords,
-                raw_text_snippet,
-                processed_at,
-                updated_at
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
+            SELECT file_path, EXTRACT(EPOCH FROM processed_at)
+            FROM papers
+            WHERE processed_at IS NOT NULL
+                AND starts_with(file_path, %s)
+                AND metadata_source IS NOT NULL
+                AND (NOT %s OR metadata_source = 'grobid');
+            """,
+            (f"{directory}{os.sep}", grobid_only),
+        )
+        return {file_path: float(processed_at) for file_path, processed_at in cur.fetchall()}
+
+
+def is_unchanged(pdf_path: Path, processed_times: Dict[str, float]) -> bool:
+    processed_at = processed_times.get(str(pdf_path))
+    return processed_at is not None and pdf_path.stat().st_mtime <= processed_at
+
+
+def iter_changed_pdfs(
+    pdf_paths: Iterable[Path],
+    processed_times: Dict[str, float],
+    seen: Set[str],
+    counts: Counter,
+) -> Iterator[Path]:
+    """Yield PDFs that need ingesting, each at most once.
+
+    Files are renamed while the directory scan is still running, and the scan
+    may return a renamed entry again. Paths already yielded or produced by a
+    rename are tracked in seen so they are not processed twice.
+    """
+    for pdf_path in pdf_paths:
+        key = str(pdf_path)
+        if key in seen:
+            continue
+        seen.add(key)
+        if is_unchanged(pdf_path, processed_times):
+            counts["skipped"] += 1
+        else:
+            yield pdf_path
+
+
+def paper_row(file_path: Path, metadata: Dict) -> tuple:
+    return (str(file_path),) + tuple(metadata[column] for column in PAPER_COLUMNS[1:])
+
+
+def to_pg_array(values: List[str]) -> str:
+    items = []
+    for value in values:
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        items.append(f'"{escaped}"')
+    return "{" + ",".join(items) + "}"
+
+
+def to_copy_field(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, list):
+        value = to_pg_array(value)
+    elif isinstance(value, date):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def upsert_papers_batch(conn, rows: List[tuple]) -> None:
+    if not rows:
+        return
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(to_copy_field(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    columns = ", ".join(PAPER_COLUMNS)
+    with conn.cursor() as cur:
+        cur.copy_expert(f"COPY papers_stage ({columns}) FROM STDIN", buffer)
+        cur.execute(
+            f"""
+            INSERT INTO papers ({columns}, processed_at, updated_at)
+            SELECT {columns}, NOW(), NOW() FROM papers_stage
             ON CONFLICT (file_path) DO UPDATE SET
                 title = EXCLUDED.title,
                 document_type = EXCLUDED.document_type,
@@ -386,25 +660,11 @@ def upsert_paper(conn, file_path: Path, metadata: dict) -> None:
                 year = EXCLUDED.year,
                 keywords = EXCLUDED.keywords,
                 raw_text_snippet = EXCLUDED.raw_text_snippet,
+                metadata_source = EXCLUDED.metadata_source,
                 processed_at = NOW(),
                 updated_at = NOW();
-            """,
-            (
-                str(file_path),
-                metadata["title"],
-                metadata["document_type"],
-                metadata["publication_date"],
-                metadata["journal_title"],
-                metadata["book_title"],
-                metadata["publisher"],
-                metadata["authors"],
-                metadata["affiliations"],
-                metadata["countries"],
-                metadata["abstract"],
-                metadata["year"],
-                metadata["keywords"],
-                metadata["raw_text_snippet"],
-            ),
+            TRUNCATE papers_stage;
+            """
         )
 
 
@@ -416,6 +676,17 @@ def main() -> None:
     parser.add_argument("--no-grobid", action="store_true", help="Skip GROBID metadata extraction.")
     parser.add_argument("--grobid-url", default=DEFAULT_GROBID_URL, help="Base URL for GROBID.")
     parser.add_argument("--no-rename", action="store_true", help="Skip PDF renaming.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of PDFs processed concurrently (match GROBID's concurrency setting).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-ingest PDFs that have not changed since they were last processed.",
+    )
     args = parser.parse_args()
 
     directory = Path(args.directory).expanduser().resolve()
@@ -423,42 +694,71 @@ def main() -> None:
         raise SystemExit(f"Directory not found: {directory}")
 
     pdf_files = iter_pdfs(directory, args.recursive)
-    if not pdf_files:
+    first_pdf = next(pdf_files, None)
+    if first_pdf is None:
         print("No PDF files found.")
         return
+    pdf_files = chain([first_pdf], pdf_files)
 
     conn = None
     if not args.dry_run:
         conn = psycopg2.connect(**DEFAULT_DB_CONFIG)
+        prepare_bulk_load(conn)
 
     use_grobid = False
-    if not args.no_grobid and grobid_is_available(args.grobid_url):
-        use_grobid = True
+    if not args.no_grobid:
+        use_grobid = grobid_is_available(args.grobid_url)
+        if not use_grobid:
+            print(f"GROBID not reachable at {args.grobid_url}; using heuristic extraction.")
 
-    processed = 0
-    for pdf_path in pdf_files:
-        text = extract_text_from_pdf(pdf_path)
-        metadata = None
-        if use_grobid:
-            metadata = extract_metadata_grobid(pdf_path, args.grobid_url)
-        if not metadata:
-            metadata = extract_metadata(text)
-        metadata["raw_text_snippet"] = text[:500].strip() if text else None
-        if not args.no_rename:
-            pdf_path = rename_pdf(pdf_path, metadata, args.dry_run)
-        processed += 1
-
-        if args.dry_run:
-            print(f"[DRY RUN] {pdf_path.name} -> {metadata}")
-            continue
+    processed_times = {}
+    if conn and not args.force:
+        processed_times = fetch_processed_times(conn, directory, use_grobid)
 
-        upsert_paper(conn, pdf_path, metadata)
+    processed = 0
+    seen = set()
+    counts = Counter()
+    rows = []
+    changed_pdfs = iter_changed_pdfs(pdf_files, processed_times, seen, counts)
+    # Spawned rather than forked: the pool starts from worker threads, and the
+    # children must not inherit the DB connection or HTTP session state. Each
+    # worker process is single-threaded, which is also what keeps PDFium (not
+    # thread-safe) off the GROBID threads.
+    text_executor = ProcessPoolExecutor(
+        max_workers=TEXT_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+    with text_executor, ThreadPoolExecutor(max_workers=args.workers) as executor:
+        # Renames and DB writes stay on the main thread: the connection is not
+        # thread-safe and rename_pdf checks for name collisions.
+        results = process_pdfs(
+            executor, text_executor, changed_pdfs, use_grobid, args.grobid_url, args.workers * 2
+        )
+        for pdf_path, metadata in results:
+            if not args.no_rename:
+                renamed_path = rename_pdf(pdf_path, metadata, args.dry_run)
+                # Dry runs only report the target; it may still be another real PDF.
+                if not args.dry_run and renamed_path != pdf_path:
+                    seen.add(str(renamed_path))
+                pdf_path = renamed_path
+            processed += 1
+
+            if args.dry_run:
+                print(f"[DRY RUN] {pdf_path.name} -> {metadata}")
+                continue
+
+            rows.append(paper_row(pdf_path, metadata))
+            if len(rows) >= BATCH_SIZE:
+                upsert_papers_batch(conn, rows)
+                rows = []
 
     if conn:
+        upsert_papers_batch(conn, rows)
         conn.commit()
         conn.close()
 
     print(f"Processed {processed} papers.")
+    if counts["skipped"]:
+        print(f"Skipped {counts['skipped']} unchanged papers.")
 
 
 if __name__ == "__main__":